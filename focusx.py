@@ -0,0 +1,783 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+import argparse
+import threading
+import time
+from datetime import datetime
+import os
+import random
+import math
+import itertools
+from dataclasses import dataclass, field
+import ctypes
+from ctypes import wintypes
+import select
+import socket
+import struct
+
+# Heavy or platform-specific packages (pynput, pycaw/comtypes, tzlocal) are
+# imported where they're first needed, so the timer alone starts fast and
+# runs anywhere tkinter does.
+
+NTP_PORT = 123
+NTP_EPOCH_DELTA = 2208988800  # Seconds from 1900-01-01 (NTP epoch) to 1970-01-01
+
+
+def to_ntp_time(timestamp):
+    """Pack a Unix timestamp as a 64-bit NTP timestamp"""
+    seconds = int(timestamp)
+    fraction = int((timestamp - seconds) * 2**32)
+    return struct.pack('!2I', seconds + NTP_EPOCH_DELTA, fraction)
+
+
+def from_ntp_time(data):
+    """Unpack a 64-bit NTP timestamp into a Unix timestamp"""
+    seconds, fraction = struct.unpack('!2I', data)
+    return seconds - NTP_EPOCH_DELTA + fraction / 2**32
+
+
+@dataclass
+class NTPResponse:
+    """The parts of an NTP server reply that FocusX cares about"""
+    leap: int
+    stratum: int
+    root_delay: float  # Seconds
+    root_dispersion: float  # Seconds
+    offset: float  # Seconds to add to the local clock
+    delay: float  # Round trip, in seconds
+
+    @classmethod
+    def from_packet(cls, data, sent_at, received_at):
+        """Parse a 48-byte server packet, timing it per RFC 5905 section 8"""
+        root_delay, root_dispersion = struct.unpack('!2I', data[4:12])
+        receive = from_ntp_time(data[32:40])
+        transmit = from_ntp_time(data[40:48])
+        return cls(leap=data[0] >> 6,
+                   stratum=data[1],
+                   root_delay=root_delay / 2**16,
+                   root_dispersion=root_dispersion / 2**16,
+                   offset=((receive - sent_at) + (transmit - received_at)) / 2,
+                   delay=(received_at - sent_at) - (transmit - receive))
+
+
+# "00" to "99", so the per-second countdown update is just two lookups
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(100))
+
+
+def format_time(seconds):
+    """Format a number of seconds as MM:SS"""
+    minutes, seconds = divmod(seconds, 60)
+    mm = _TWO_DIGIT[minutes] if minutes < 100 else str(minutes)
+    return mm + ":" + _TWO_DIGIT[seconds]
+
+
+@dataclass
+class PomodoroConfig:
+    """Settings that tell the FocusX variants apart"""
+    work_duration: int = 50 * 60  # Seconds
+    rest_duration: int = 5 * 60  # Seconds
+    enable_night_block: bool = True  # Black out the screen from 12 AM to 6 AM
+    ntp_servers: list = field(default_factory=lambda: [
+        '0.pool.ntp.org',
+        '1.pool.ntp.org',
+        '2.pool.ntp.org',
+        '3.pool.ntp.org'
+    ])
+    break_activities: list = field(default_factory=lambda: [
+        "Take time to read and reflect",
+        "Step away from the screen and rest your eyes",
+        "Go for a short walk",
+        "Do some light stretching",
+        "Practice deep breathing",
+        "Hydrate yourself",
+        "Tidy up your workspace"
+    ])
+
+
+class InputBlocker:
+    """Swallow keyboard and mouse input while blocking is on.
+    
+    On Windows this installs low-level keyboard/mouse hooks on the Tk thread,
+    whose message loop services them. Elsewhere it falls back to pynput
+    listeners with suppression turned on.
+    """
+    WH_KEYBOARD_LL = 13
+    WH_MOUSE_LL = 14
+
+    def __init__(self):
+        self.blocking = False
+        self._owners = set()  # Who currently wants input blocked
+        self._hooks = []
+        self._listeners = []
+        self._user32 = None
+        self._kernel32 = None
+        if os.name == 'nt':
+            self._user32 = ctypes.WinDLL('user32', use_last_error=True)
+            self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            # Declare the handle type so 64-bit module handles aren't truncated to an int
+            self._kernel32.GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+            self._kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+            hookproc = ctypes.WINFUNCTYPE(wintypes.LPARAM, ctypes.c_int,
+                                          wintypes.WPARAM, wintypes.LPARAM)
+            self._user32.SetWindowsHookExW.argtypes = (ctypes.c_int, hookproc,
+                                                       wintypes.HINSTANCE, wintypes.DWORD)
+            self._user32.SetWindowsHookExW.restype = wintypes.HHOOK
+            self._user32.CallNextHookEx.argtypes = (wintypes.HHOOK, ctypes.c_int,
+                                                    wintypes.WPARAM, wintypes.LPARAM)
+            self._user32.CallNextHookEx.restype = wintypes.LPARAM
+            self._user32.UnhookWindowsHookEx.argtypes = (wintypes.HHOOK,)
+            # Keep a reference so the callback isn't garbage collected
+            self._proc = hookproc(self._hook_proc)
+
+    def _hook_proc(self, code, wparam, lparam):
+        """Low-level hook callback: a non-zero return drops the event"""
+        if code >= 0 and self.blocking:
+            return 1
+        return self._user32.CallNextHookEx(None, code, wparam, lparam)
+
+    def start(self, owner):
+        """Start swallowing input on behalf of owner (e.g. 'break' or 'night')"""
+        self._owners.add(owner)
+        if self.blocking:
+            return
+        self.blocking = True
+        if self._user32:
+            module = self._kernel32.GetModuleHandleW(None)
+            for hook_id in (self.WH_KEYBOARD_LL, self.WH_MOUSE_LL):
+                hook = self._user32.SetWindowsHookExW(hook_id, self._proc, module, 0)
+                if hook:
+                    self._hooks.append(hook)
+                else:
+                    print(f"Could not install input hook (error {ctypes.get_last_error()})")
+        else:
+            try:
+                from pynput.mouse import Listener as MouseListener
+                from pynput.keyboard import Listener as KeyboardListener
+            except ImportError:
+                print("Could not block input: pynput is not installed")
+                return
+            self._listeners = [MouseListener(suppress=True),
+                               KeyboardListener(suppress=True)]
+            for listener in self._listeners:
+                listener.start()
+
+    def stop(self, owner=None):
+        """Release owner's hold on input, or every hold if owner is None;
+        input only comes back once nobody is holding it"""
+        if owner is None:
+            self._owners.clear()
+        else:
+            self._owners.discard(owner)
+        if self._owners:
+            return
+        self.blocking = False
+        for hook in self._hooks:
+            self._user32.UnhookWindowsHookEx(hook)
+        self._hooks = []
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners = []
+
+
+class PomodoroBlocker:
+    def __init__(self, config=None):
+        self.config = config or PomodoroConfig()
+        
+        # Create the main window
+        self.root = tk.Tk()
+        self.root.title("Focus Time")
+        
+        # Window positioning
+        window_width = 400
+        window_height = 300
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        center_x = int(screen_width/2 - window_width/2)
+        center_y = int(screen_height/2 - window_height/2)
+        self.root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
+        
+        self.root.attributes('-topmost', True)
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
+        
+        # Simple color scheme
+        self.colors = {
+            'bg': '#ffffff',
+            'primary': '#1a73e8',
+            'warning': '#ea4335',
+            'text': '#202124'
+        }
+        
+        self.root.configure(bg=self.colors['bg'])
+        
+        # Timer settings
+        self.work_duration = self.config.work_duration
+        self.rest_duration = self.config.rest_duration
+        self.is_running = False
+        self.is_work_session = True
+        self._deadline = 0.0
+        self._after_id = None
+        self._last_time_str = None
+        self._phase_wall_start = 0.0
+        self._phase_mono_start = 0.0
+        self._tick_count = 0
+        self.wall_check_interval = 30  # Ticks between checks against the wall clock
+        self.max_clock_drift = 5  # Seconds the clocks may disagree before we catch up
+        
+        # Time sync settings
+        self.ntp_servers = self.config.ntp_servers
+        self._server_ips = []
+        self._resolved_at = 0.0
+        # Re-resolve every other resync (the gap is at most 65 minutes), or after a failed sync
+        self.resolve_interval = 2 * 3600
+        self.max_parallel_queries = 4
+        self.ntp_timeouts = (1.5, 6.0)  # A quick pass, then a patient one for slow replies
+        self._target_offset = 0.0  # Latest offset reported by NTP
+        self._applied_offset = 0.0  # Offset actually in use, slewed toward the target
+        self._last_slew = time.monotonic()
+        self.max_slew_rate = 0.05  # Correct by at most 50 ms per second...
+        self.max_offset_step = 5  # ...unless we're more than 5 seconds off
+        self._offset_ready = False
+        self._resync_after_id = None
+        # Only garbage replies are this far off; a tampered clock may well be hours out
+        self.max_time_offset = 365 * 24 * 3600
+        self.local_timezone = None
+        if self.config.enable_night_block:
+            try:
+                from tzlocal import get_localzone
+                self.local_timezone = get_localzone()
+            except ImportError:
+                print("tzlocal is not installed, using the system's current UTC offset")
+                self.local_timezone = datetime.now().astimezone().tzinfo
+        self._tz_offset_sec = 0.0  # Local UTC offset, refreshed hourly to catch DST changes
+        
+        # Break messages
+        self.break_activities = self.config.break_activities
+        self.message_interval = 5  # Seconds between break messages
+        self._msg_next_ts = 0.0
+        self.shuffle_messages()
+        
+        self.overlay = None
+        self.night_overlay = None
+        self.setup_ui()
+        
+        self.input_blocker = InputBlocker()
+        
+        # Audio control, set up on first use so pycaw only loads once a timer runs
+        self.audio = None
+        self._audio_initialized = False
+        self._muted = None  # Last mute state we applied; None until the first call
+
+    def _resolve_pool(self):
+        """Resolve the NTP pool names to a list of server IPs, cached between syncs"""
+        if self._server_ips and time.monotonic() - self._resolved_at < self.resolve_interval:
+            return self._server_ips
+        
+        resolved = []
+        for server in self.ntp_servers:
+            try:
+                infos = socket.getaddrinfo(server, NTP_PORT, socket.AF_INET, socket.SOCK_DGRAM)
+            except socket.gaierror:
+                continue
+            ips = []
+            for info in infos:
+                if info[4][0] not in ips:
+                    ips.append(info[4][0])
+            resolved.append(ips)
+        
+        # Interleave so the first few queries go to different pool names
+        self._server_ips = []
+        for i in range(max((len(ips) for ips in resolved), default=0)):
+            self._server_ips.extend(ips[i] for ips in resolved if i < len(ips))
+        self._resolved_at = time.monotonic()
+        return self._server_ips
+
+    def sync_time(self):
+        """Synchronize time with NTP servers, keeping the first good answer"""
+        if not self.config.enable_night_block:
+            return
+        
+        server_ips = self._resolve_pool()
+        if not server_ips:
+            print("Warning: Could not resolve any time server, using system time")
+            return
+        
+        # Ask several servers at once so a dead one doesn't hold up the rest,
+        # moving on to the next few pool members if the first round fails
+        batch = self.max_parallel_queries
+        result = None
+        for attempt, timeout in enumerate(self.ntp_timeouts):
+            servers = server_ips[attempt * batch:(attempt + 1) * batch] or server_ips[:batch]
+            result = self._race_servers(servers, timeout)
+            if result is not None:
+                break
+        if result is None:
+            self._server_ips = []  # Pick up fresh pool members next time
+            print("Warning: Could not sync with any time server, using system time")
+            return
+        
+        server, response = result
+        self._target_offset = response.offset
+        self._offset_ready = True
+        print(f"Time synchronized with {server}, offset: {response.offset:.2f} seconds")
+
+    def _race_servers(self, server_ips, timeout):
+        """Query all servers over one UDP socket; return (ip, response) for the
+        first valid reply, or None if none arrives within timeout seconds"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            # Servers echo our transmit timestamp back, which ties each reply to its request
+            pending = {}
+            for ip in server_ips:
+                sent_at = time.time()
+                stamp = to_ntp_time(sent_at)
+                try:
+                    sock.sendto(b'\x1b' + b'\x00' * 39 + stamp, (ip, NTP_PORT))
+                except OSError:
+                    continue
+                pending[ip] = (sent_at, stamp)
+            
+            deadline = time.monotonic() + timeout
+            while pending:
+                wait = deadline - time.monotonic()
+                if wait <= 0 or not select.select([sock], [], [], wait)[0]:
+                    return None
+                try:
+                    data, addr = sock.recvfrom(512)
+                except OSError:
+                    continue  # e.g. an ICMP port unreachable from one of the servers
+                received_at = time.time()
+                
+                request = pending.get(addr[0])
+                if request is None or len(data) < 48 or data[0] & 0x7 != 4:
+                    continue  # Not a server reply
+                sent_at, stamp = request
+                if data[24:32] != stamp:
+                    continue  # Stale or spoofed reply
+                del pending[addr[0]]
+                
+                response = NTPResponse.from_packet(data, sent_at, received_at)
+                if self._valid_response(response):
+                    return addr[0], response
+            return None
+        finally:
+            sock.close()
+
+    def _valid_response(self, response):
+        """Reject NTP answers from unsynchronized or implausible servers"""
+        if response.leap == 3 or not 0 < response.stratum < 16:
+            return False  # Clock not synchronized, or a kiss-of-death packet
+        if response.root_delay + response.root_dispersion >= 1.0:
+            return False  # Server is too far from its reference clock to trust
+        return abs(response.offset) <= self.max_time_offset
+
+    def current_offset(self):
+        """Get the NTP offset, easing toward the latest sync instead of jumping"""
+        now = time.monotonic()
+        elapsed = now - self._last_slew
+        self._last_slew = now
+        
+        delta = self._target_offset - self._applied_offset
+        if abs(delta) > self.max_offset_step:
+            self._applied_offset = self._target_offset
+        else:
+            step = self.max_slew_rate * elapsed
+            self._applied_offset += max(-step, min(step, delta))
+        return self._applied_offset
+
+    def accurate_timestamp(self):
+        """Get the current Unix timestamp considering NTP offset"""
+        if self._offset_ready:
+            return time.time() + self.current_offset()
+        return time.time()
+
+    def get_accurate_time(self):
+        """Get current time considering NTP offset"""
+        return datetime.fromtimestamp(self.accurate_timestamp(), self.local_timezone)
+
+    def _refresh_tz_offset(self):
+        """Cache the local UTC offset; rechecked every hour for DST changes"""
+        self._tz_offset_sec = datetime.now(self.local_timezone).utcoffset().total_seconds()
+        self.root.after(3_600_000, self._refresh_tz_offset)
+
+    def is_night_time(self):
+        """Check if current time is between 12 AM and 6 AM"""
+        local_ts = self.accurate_timestamp() + self._tz_offset_sec
+        return 0 <= int(local_ts // 3600) % 24 < 6
+
+    def create_night_overlay(self):
+        """Create overlay for night-time blocking"""
+        if self.night_overlay or not self.config.enable_night_block:
+            return
+            
+        self.night_overlay = tk.Toplevel(self.root)
+        self.night_overlay.attributes('-fullscreen', True, '-topmost', True)
+        self.night_overlay.configure(bg='black')
+        
+        message = tk.Label(
+            self.night_overlay,
+            text="It's late night hours (12 AM - 6 AM).\nPlease get some rest.",
+            font=('Arial', 24),
+            fg='white',
+            bg='black',
+            justify='center'
+        )
+        message.pack(expand=True)
+        
+        time_label = tk.Label(
+            self.night_overlay,
+            font=('Arial', 18),
+            fg='white',
+            bg='black'
+        )
+        time_label.pack(pady=20)
+        
+        def update_time():
+            # Stop once this overlay is gone, even if a new one has replaced it
+            try:
+                if not self.night_overlay or not time_label.winfo_exists():
+                    return
+                current_time = self.get_accurate_time()
+                time_label.config(text=f"Current time: {current_time.strftime('%I:%M:%S %p')}")
+                self.night_overlay.after(1000, update_time)
+            except tk.TclError:
+                return
+        
+        update_time()
+        self.block_input('night')
+
+    def remove_night_overlay(self):
+        """Remove night-time blocking overlay"""
+        if self.night_overlay:
+            self.night_overlay.destroy()
+            self.night_overlay = None
+            self.unblock_input('night')
+
+    def start_time_monitoring(self):
+        """Start monitoring time for night-time blocking"""
+        if not self.config.enable_night_block:
+            return
+        
+        self._refresh_tz_offset()
+        self._check_night()
+        self._schedule_resync()
+
+    def _schedule_resync(self):
+        """Resync time roughly every hour, jittered to stay off the top of the hour"""
+        delay = 3600 + random.uniform(-300, 300)
+        self._resync_after_id = self.root.after(int(delay * 1000), self._resync)
+
+    def _resync(self):
+        """Run one NTP sync on a short-lived thread, then schedule the next"""
+        threading.Thread(target=self.sync_time, daemon=True).start()
+        self._schedule_resync()
+
+    def cancel_resync(self):
+        """Stop the hourly time resync"""
+        if self._resync_after_id:
+            self.root.after_cancel(self._resync_after_id)
+            self._resync_after_id = None
+
+    def _check_night(self):
+        """Show or remove the night overlay, then check again in 30 seconds"""
+        if self.is_night_time():
+            if not self.night_overlay:
+                self.create_night_overlay()
+        else:
+            if self.night_overlay:
+                self.remove_night_overlay()
+        self.root.after(30_000, self._check_night)
+
+    def init_audio_control(self):
+        """Initialize audio control capabilities"""
+        self._audio_initialized = True
+        try:
+            from comtypes import CLSCTX_ALL, COMError
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+        except ImportError:
+            print("Could not initialize audio control")
+            return
+        try:
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            self.audio = ctypes.cast(interface, ctypes.POINTER(IAudioEndpointVolume))
+        except (OSError, COMError):
+            print("Could not initialize audio control")
+
+    def set_muted(self, muted):
+        """Mute or unmute system audio, skipping the call if nothing changes"""
+        if not self._audio_initialized:
+            self.init_audio_control()
+        if not self.audio or muted == self._muted:
+            return
+        from comtypes import COMError  # Already loaded by init_audio_control
+        try:
+            self.audio.SetMute(int(muted), None)
+            self._muted = muted
+        except (OSError, COMError):
+            print(f"Could not {'mute' if muted else 'unmute'} audio")
+
+    def mute_audio(self):
+        """Mute system audio"""
+        self.set_muted(True)
+
+    def unmute_audio(self):
+        """Unmute system audio"""
+        self.set_muted(False)
+
+    def setup_ui(self):
+        """Set up the simplified UI"""
+        main_frame = tk.Frame(self.root, bg=self.colors['bg'])
+        main_frame.pack(expand=True, fill='both', padx=20, pady=20)
+        
+        # Timer display
+        self.time_var = tk.StringVar(value=format_time(self.work_duration))
+        self.time_label = tk.Label(main_frame,
+                                 textvariable=self.time_var,
+                                 font=('Helvetica', 48, 'bold'),
+                                 fg=self.colors['text'],
+                                 bg=self.colors['bg'])
+        self.time_label.pack(pady=20)
+        
+        # Status display
+        self.status_var = tk.StringVar(value="Ready to focus")
+        self.status_label = tk.Label(main_frame,
+                                   textvariable=self.status_var,
+                                   font=('Helvetica', 14),
+                                   fg=self.colors['primary'],
+                                   bg=self.colors['bg'])
+        self.status_label.pack(pady=10)
+        
+        # Start button
+        self.start_button = tk.Button(main_frame,
+                                    text="Start",
+                                    command=self.start_timer,
+                                    bg=self.colors['primary'],
+                                    fg='white',
+                                    width=10)
+        self.start_button.pack(pady=5)
+        
+        # Emergency stop button
+        self.stop_button = tk.Button(main_frame,
+                                   text="Emergency Stop",
+                                   command=self.stop_timer,
+                                   bg=self.colors['warning'],
+                                   fg='white',
+                                   width=20)
+        self.stop_button.pack(pady=5)
+        
+        # Break overlay, built once and kept hidden between breaks
+        self.create_overlay()
+
+    def create_overlay(self):
+        """Create a simple black overlay with periodic message display"""
+        self.overlay = tk.Toplevel(self.root)
+        self.overlay.withdraw()
+        self.overlay.configure(bg='black')
+        # The overlay is reused across breaks, so closing it must not destroy it
+        self.overlay.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        self.message_label = tk.Label(self.overlay,
+                                      font=('Arial', 24),
+                                      fg='white',
+                                      bg='black',
+                                      wraplength=800)
+        self.message_label.pack(expand=True)
+        
+        self.break_timer_label = tk.Label(self.overlay,
+                                          font=('Arial', 18),
+                                          fg='white',
+                                          bg='black')
+        self.break_timer_label.pack(pady=20)
+
+    def show_overlay(self):
+        """Black out the screen for a break"""
+        if not self.overlay.winfo_exists():
+            self.create_overlay()  # Destroyed from outside; build a fresh one
+        self.message_label.config(text=next(self._msg_iter))
+        self._msg_next_ts = time.monotonic() + self.message_interval
+        self.overlay.deiconify()
+        self.overlay.attributes('-fullscreen', True, '-topmost', True)
+
+    def hide_overlay(self):
+        """Take the break overlay off the screen"""
+        if self.overlay.winfo_exists():
+            self.overlay.withdraw()
+
+    def shuffle_messages(self):
+        """Show every break message once, in random order, before repeating"""
+        self._msg_iter = itertools.cycle(
+            random.sample(self.break_activities, k=len(self.break_activities)))
+
+    def update_display(self, remaining):
+        """Refresh the break overlay; called from the timer tick"""
+        try:
+            if not self.overlay or not self.overlay.winfo_exists():
+                return
+            self.break_timer_label.config(text=f"Break time remaining: {format_time(remaining)}")
+            
+            # Rotate the message every few seconds
+            now = time.monotonic()
+            if now >= self._msg_next_ts:
+                self.message_label.config(text=next(self._msg_iter))
+                self._msg_next_ts = now + self.message_interval
+        except tk.TclError:
+            return
+
+    def start_timer(self):
+        """Start the timer cycles"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self.is_work_session = True
+        self._enter_phase()
+
+    def stop_timer(self):
+        """Emergency stop"""
+        self.is_running = False
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.cleanup()
+
+    def _enter_phase(self):
+        """Set up the current session and start its countdown"""
+        if self.is_work_session:
+            self.status_var.set("Work Session")
+            self.unblock_input('break')
+            self.unmute_audio()
+            self.hide_overlay()
+            self.countdown(self.work_duration)
+        else:
+            self.status_var.set("Break Time")
+            self.show_overlay()
+            self.block_input('break')
+            self.mute_audio()
+            self.countdown(self.rest_duration)
+
+    def _advance_phase(self):
+        """Switch between work and break sessions"""
+        self.is_work_session = not self.is_work_session
+        self._enter_phase()
+
+    def countdown(self, duration):
+        """Timer countdown, driven by the Tk event loop"""
+        self._phase_mono_start = time.monotonic()
+        self._phase_wall_start = time.time()
+        self._deadline = self._phase_mono_start + duration
+        self._last_time_str = None
+        self._tick_count = 0
+        self._tick()
+
+    def _tick(self):
+        """Refresh the countdown display and switch sessions when time is up"""
+        self._after_id = None
+        if not self.is_running:
+            return
+        
+        # Keep the NTP correction easing in even when nothing else reads the clock
+        self.current_offset()
+        
+        self._tick_count += 1
+        if self._tick_count % self.wall_check_interval == 0:
+            self._catch_up_to_wall_clock()
+        
+        left = self._deadline - time.monotonic()
+        if left <= 0:
+            self._advance_phase()
+            return
+        
+        remaining = math.ceil(left)
+        time_str = format_time(remaining)
+        # Only touch the labels when the text actually changes
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self.time_var.set(time_str)
+            if not self.is_work_session:
+                self.update_display(remaining)
+        
+        # Wake up right after the displayed second rolls over
+        delay = int((left - (remaining - 1)) * 1000) + 1
+        self._after_id = self.root.after(delay, self._tick)
+
+    def _catch_up_to_wall_clock(self):
+        """Move the deadline up if the monotonic clock paused, e.g. while the
+        computer was asleep, so the session ends when it really should"""
+        # Raw system time on purpose: NTP corrections aren't elapsed time
+        wall_elapsed = time.time() - self._phase_wall_start
+        mono_elapsed = time.monotonic() - self._phase_mono_start
+        drift = wall_elapsed - mono_elapsed
+        if drift > self.max_clock_drift:
+            self._deadline -= drift
+            self._phase_mono_start -= drift
+
+    def cleanup(self):
+        """Reset everything"""
+        self.hide_overlay()
+        self.unblock_input('break')
+        self.unmute_audio()
+        self.time_var.set(format_time(self.work_duration))
+        self.status_var.set("Ready to focus")
+        self.is_work_session = True
+        self.shuffle_messages()
+
+    def block_input(self, owner):
+        """Block mouse and keyboard for a break or the night overlay"""
+        self.input_blocker.start(owner)
+
+    def unblock_input(self, owner=None):
+        """Unblock mouse and keyboard, unless another owner still holds them"""
+        self.input_blocker.stop(owner)
+
+    def shutdown(self):
+        """Stop timers and resyncs, release input and audio, and close the app"""
+        self.cancel_resync()
+        if self.is_running:
+            self.stop_timer()
+        self.unblock_input()
+        self.root.destroy()
+
+    def run(self):
+        """Start the application"""
+        if self.config.enable_night_block:
+            # Sync in the background so the window can paint right away;
+            # until then get_accurate_time falls back to system time
+            threading.Thread(target=self.sync_time, daemon=True).start()
+        
+        # Check for night time now, then every 30 seconds
+        self.start_time_monitoring()
+        self.root.mainloop()
+
+
+def positive_minutes(value):
+    """argparse type for session lengths: a whole number of minutes, at least 1"""
+    minutes = int(value)
+    if minutes < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 minute, got {value}")
+    return minutes
+
+
+def main(argv=None, first_message=None):
+    """Parse command line options and start FocusX
+    
+    first_message, if given, replaces the first break activity.
+    """
+    parser = argparse.ArgumentParser(description="FocusX: No Distractions. Just Focus.")
+    parser.add_argument('--work-min', type=positive_minutes, default=50,
+                        help="length of a work session in minutes (default: 50)")
+    parser.add_argument('--rest-min', type=positive_minutes, default=5,
+                        help="length of a break in minutes (default: 5)")
+    parser.add_argument('--night-block', action=argparse.BooleanOptionalAction, default=True,
+                        help="black out the screen from 12 AM to 6 AM (default: on)")
+    args = parser.parse_args(argv)
+    
+    config = PomodoroConfig(work_duration=args.work_min * 60,
+                            rest_duration=args.rest_min * 60,
+                            enable_night_block=args.night_block)
+    if first_message:
+        config.break_activities[0] = first_message
+    app = PomodoroBlocker(config)
+    app.run()
+
+if __name__ == "__main__":
+    main()